@@ -1,11 +1,142 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import aiohttp
+import asyncio
+from lxml import html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 import re
+import os
 import csv
 import logging
 import datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from urllib.parse import urljoin, urlparse, parse_qs
 
+# Maximum number of pages kept in the HTML cache before least-recently-used eviction
+CACHE_MAX_ENTRIES = 4096
+
+# Created once and reused: the lxml parser backing every fromstring call, so no
+# per-call parser lookup or setup is paid
+LXML_PARSER = lxml_html.HTMLParser()
+
+# Compiled once: any run of whitespace, for collapsing extracted card text
+WS_RE = re.compile(r'\s+')
+
+# Compiled once: GitHub links advertised as 'pip install git+...' in the page text
+# (bytes patterns so they run on the undecoded response body)
+PIP_RE = re.compile(rb'pip install git\+(https://github\.com/\S+)')
+
+# Compiled once: GitHub links appearing in any href attribute of the raw HTML
+HREF_RE = re.compile(rb'href=["\'](https?://github\.com/[^"\']+)')
+
+# Union selector for the header, sidebar, and button nodes excluded from model card text
+CARD_EXCLUDE_SELECTOR = (
+    'header.from-gray-50-to-white.border-b.border-gray-100, '
+    'div.pt-8.border-gray-100.md\\:col-span-5, '
+    'section.pt-8.border-gray-100.md\\:col-span-5, '
+    'a.btn.mb-6.text-sm.text-gray-600'
+)
+
+# Integer ids for the tag categories, used to index the per-page tuple of tag lists
+# (avoids allocating and hashing a fresh heading-keyed dict per model page)
+TASK, LIBRARY, LANGUAGE, OTHERS, ARXIV, LICENSE, DATASET = range(7)
+
+# Compiled once: one alternation that categorizes an anchor href in a single match;
+# the index of the group that matched picks the category id out of CAT_GROUP_IDS
+CAT_RE = re.compile(
+    r'^/models\?(?:(pipeline_tag=)|(library=)|(language=)|(license=license%3A)|(dataset=dataset%3A)|(other=))'
+)
+
+# Category ids in CAT_RE group order, indexed by m.lastindex - 1
+CAT_GROUP_IDS = (TASK, LIBRARY, LANGUAGE, LICENSE, DATASET, OTHERS)
+
+# Parse one model page's HTML into its card text, GitHub links, and categorized tags
+def parse_model_page(response_text):
+    """
+    Parse a single model page's HTML into (cleaned_text, github_links, category_items).
+
+    Kept as a module-level function (rather than a method) so it can be pickled and
+    farmed out to worker processes.
+
+    Args:
+        response_text (bytes): The raw HTML of a Hugging Face model page.
+
+    Returns:
+        tuple: The cleaned model card text, comma-separated unique GitHub links, and the
+        7-tuple of tag lists indexed by category id.
+    """
+
+    # Parse the HTML content with selectolax (lexbor detects the encoding itself in C)
+    tree = LexborHTMLParser(response_text)
+
+    # Collect unique GitHub links straight from the raw HTML with the precompiled
+    # bytes patterns — no DOM walk or full decode is needed for a purely textual
+    # extraction; only the matched links themselves get decoded. dict.fromkeys
+    # deduplicates while preserving insertion order, so output is deterministic
+    unique_github_links = dict.fromkeys(link.decode('utf-8', 'ignore') for link in PIP_RE.findall(response_text))
+    for link in HREF_RE.findall(response_text):
+        unique_github_links[link.decode('utf-8', 'ignore')] = None
+
+    # Initialize empty lists for all categories, indexed by category id
+    category_items = ([], [], [], [], [], [], [])
+
+    # Walk the <a> tags once, collecting the categorized tags
+    for a_tag in tree.css('a'):
+        href = a_tag.attributes.get('href') or ''
+
+        # Categorize the href with a single regex match; skip non-matching anchors
+        match = CAT_RE.match(href)
+        if not match:
+            continue
+        category = CAT_GROUP_IDS[match.lastindex - 1]
+
+        # Arxiv tags share the '/models?other=' prefix
+        if category == OTHERS and '=arxiv%' in href:
+            category = ARXIV
+
+        tag_text = a_tag.text().strip()
+        # Remove newline characters from the tag_text
+        tag_text = tag_text.replace('\n', '')
+        if category == LICENSE:
+            # Remove 'License:' prefix
+            tag_text = tag_text.replace('License: ', '')
+        category_items[category].append(tag_text)
+
+    # Find the <main> element with class "flex flex-1 flex-col"
+    main_element = tree.css_first('main.flex.flex-1.flex-col')
+
+    if main_element:
+        # Remove the header, sidebar, and button nodes in a single traversal
+        for excluded in main_element.css(CARD_EXCLUDE_SELECTOR):
+            excluded.decompose()
+
+        # Extract all the text from the <main> element and collapse whitespace
+        # in a single regex pass instead of splitlines/strip/join
+        cleaned_text = WS_RE.sub(' ', main_element.text(separator=' ')).strip()
+    else:
+        cleaned_text = ''
+
+    return cleaned_text, ', '.join(unique_github_links), category_items
+
+# Parse a chunk of model pages inside a worker process
+def parse_model_pages_chunk(html_pages):
+    """
+    Parse a chunk of model page HTML documents and return their detail tuples.
+
+    This is the unit of work shipped to each ProcessPoolExecutor worker; pages that
+    failed to fetch (None) are skipped, matching the single-process path.
+
+    Args:
+        html_pages (list): Raw HTML documents (or None for failed fetches).
+
+    Returns:
+        list: One parse_model_page result per fetched document.
+    """
+
+    return [parse_model_page(response_text) for response_text in html_pages if response_text is not None]
+
 # Create a class named HuggingFaceScraper
 class HuggingFaceScraper:
     """
@@ -24,29 +155,17 @@ class HuggingFaceScraper:
         get_or_cache_html(url, cache):
             Retrieves HTML content from the cache if available, or fetches and caches it if not.
 
+        fetch_all(urls, cache):
+            Fetches all uncached URLs concurrently with aiohttp and fills the cache.
+
         generate_model_page_urls_with_pagination(base_url, batch_size=50):
             Generates a list of model page URLs with pagination.
 
-        scrape_model_names(href_values, cache):
-            Scrapes model names from a list of Hugging Face model page URLs.
-
-        scrape_model_repositories(href_values, cache):
-            Scrapes model repositories from a list of Hugging Face model page URLs.
-
-        model_addresses(href_values, cache):
-            Scrapes model addresses from Hugging Face model pages.
-
-        fetch_huggingface_model_urls(href_values, cache):
-            Scrapes Hugging Face model URLs from a list of model page URLs.
+        scrape_listing_pages(href_values, cache):
+            Scrapes model names, repositories, addresses, and URLs from the listing pages in one pass.
 
-        scrape_github_links(model_urls, cache):
-            Scrapes GitHub links related to the Hugging Face models.
-
-        scrape_model_cards(model_urls, cache):
-            Scrapes and extracts model card text from Hugging Face model pages.
-
-        scrape_category_tags(model_urls, cache):
-            Scrapes categorized tags from a list of Hugging Face model page URLs.
+        scrape_model_details(model_urls, cache):
+            Scrapes model card text, GitHub links, and categorized tags from the model pages in one pass.
 
         save_to_csv(data, csv_file_path):
             Saves scraped data to a CSV file.
@@ -64,7 +183,8 @@ class HuggingFaceScraper:
         """
         Initializes the HuggingFaceScraper instance.
 
-        Sets up the log filename with the current date and configures logging to write logs to a specified file.
+        Sets up the log filename with the current date, configures logging to write logs to a specified file,
+        and creates a pooled requests session so synchronous fetches reuse TCP connections.
         """
 
         # Initialize the log filename with the current date
@@ -73,6 +193,10 @@ class HuggingFaceScraper:
         # Configure logging to write logs to the specified file
         logging.basicConfig(filename=self.log_filename, level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
+        # Create a session with a connection pool so repeated requests reuse TCP+TLS connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
     # Method to fetch HTML content from a given URL
     def fetch_html_content(self, url):
         """
@@ -82,18 +206,19 @@ class HuggingFaceScraper:
             url (str): The URL to fetch HTML content from.
 
         Returns:
-            str or None: The text content of the response if the request is successful,or None if an error occurs during the request.
+            bytes or None: The body of the response if the request is successful,or None if an error occurs during the request.
         """
 
         try:
-            # Send an HTTP GET request to the URL
-            response = requests.get(url)
+            # Send an HTTP GET request to the URL, reusing the pooled session connection
+            response = self.session.get(url, timeout=10)
 
             # Raise an exception if the response status code is not OK
             response.raise_for_status()
 
-            # Return the text content of the response
-            return response.text
+            # Return the raw body of the response — skipping requests' charset
+            # detection and decode pass; the HTML parsers handle encoding in C
+            return response.content
 
         except Exception as e:
             # Log an error message if an exception occurs during the request
@@ -105,25 +230,85 @@ class HuggingFaceScraper:
         """
         Fetches and caches HTML content for a given URL if not already cached.
 
-        If the HTML content for the specified URL is already present in the cache, it is returned.
-        Otherwise, the content is fetched from the URL using the 'fetch_html_content' method,
-        cached for future use, and then returned.
+        If the HTML content for the specified URL is already present in the cache, it is returned
+        and marked as most recently used. Otherwise, the content is fetched from the URL using the
+        'fetch_html_content' method, cached for future use, and then returned. The cache is capped
+        at CACHE_MAX_ENTRIES pages; the least recently used entries are evicted beyond that.
 
         Args:
             url (str): The URL to fetch and cache HTML content from.
-            cache (dict): A dictionary used for caching fetched HTML content.
+            cache (OrderedDict): An ordered dictionary used for caching fetched HTML content.
 
         Returns:
             str: The HTML content of the specified URL.
         """
 
         if url in cache:
+            # Mark the entry as most recently used
+            cache.move_to_end(url)
             return cache[url]
         else:
             html_content = self.fetch_html_content(url)
             cache[url] = html_content
+
+            # Evict the least recently used entries once the cache exceeds its cap
+            while len(cache) > CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+
             return html_content
 
+    # Coroutine to fetch a single URL and store the result in the cache
+    async def fetch_one(self, session, url, cache):
+        """
+        Fetch HTML content for a single URL asynchronously and store it in the cache.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to issue the request.
+            url (str): The URL to fetch HTML content from.
+            cache (dict): A dictionary used for caching fetched HTML content.
+
+        On failure the error is logged and None is cached so callers can skip the URL.
+        """
+
+        try:
+            # Send an HTTP GET request to the URL
+            async with session.get(url) as response:
+                # Raise an exception if the response status code is not OK
+                response.raise_for_status()
+
+                # Store the raw body of the response in the cache (decoding is the
+                # HTML parsers' job)
+                cache[url] = await response.read()
+
+        except Exception as e:
+            # Log an error message if an exception occurs during the request
+            logging.error(f"An error occurred while fetching {url}: {e}")
+            cache[url] = None
+
+    # Coroutine to fetch all uncached URLs concurrently
+    async def fetch_all(self, urls, cache):
+        """
+        Fetch HTML content for all uncached URLs concurrently and fill the cache.
+
+        Scheduling every request in one asyncio.gather overlaps the network round trips,
+        so total fetch time is bounded by the slowest response rather than the sum of all of them.
+
+        Args:
+            urls (list): The URLs to fetch HTML content from.
+            cache (dict): A dictionary used for caching fetched HTML content.
+        """
+
+        # Cap concurrent connections so we do not overwhelm the server
+        connector = aiohttp.TCPConnector(limit=32)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Schedule every uncached URL at once and wait for all of them
+            await asyncio.gather(*(self.fetch_one(session, url, cache) for url in urls if url not in cache))
+
+        # Evict the least recently used entries once the cache exceeds its cap
+        while len(cache) > CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
     # Method to generate model page URLs with pagination
     def generate_model_page_urls_with_pagination(self, base_url, batch_size=50):
         """
@@ -144,19 +329,16 @@ class HuggingFaceScraper:
 
         try:
             # Fetch HTML content from the base URL
-            base_html_content = self.get_or_cache_html(base_url, {})
+            base_html_content = self.get_or_cache_html(base_url, OrderedDict())
 
             if base_html_content is None:
                 return []
 
-            # Parse the HTML content with BeautifulSoup
-            soup = BeautifulSoup(base_html_content, 'html.parser')
+            # Parse the HTML content with lxml (libxml2 parses in C)
+            doc = lxml_html.fromstring(base_html_content, parser=LXML_PARSER)
 
-            # Find all <li> elements with class "hidden sm:block"
-            li_elements = soup.find_all('li', class_='hidden sm:block')
-
-            # Extract the last href value and determine the maximum page number
-            last_href = li_elements[-1].find('a')['href']
+            # Walk straight to the last pagination anchor with a single XPath
+            last_href = doc.xpath('//li[@class="hidden sm:block"][last()]/a/@href')[0]
             parsed_url = urlparse(last_href)
             query_params = parse_qs(parsed_url.query)
             max_page = int(query_params.get('p', [0])[0])
@@ -176,322 +358,80 @@ class HuggingFaceScraper:
             logging.error(f"An error occurred while generating model page URLs: {e}")
             return []
 
-    # Method to scrape model names from Hugging Face
-    def scrape_model_names(self, href_values, cache):
-        """
-        Scrape and extract model names from a list of Hugging Face model page URLs.
-
-        Args:
-            href_values (list): A list of URLs pointing to Hugging Face model pages.
-            cache (dict): A dictionary for caching fetched HTML content.
-
-        Returns:
-            list: A list of model names extracted from the provided URLs.
-
-        This function iterates through the list of model page URLs, fetches HTML content for each URL, and
-        extracts model names from the HTML using BeautifulSoup. Model names are typically found in the 'href'
-        attribute values within elements with the class "block p-2." The function returns a list of model names.
+    # Method to scrape model names, repositories, addresses, and URLs from the listing pages
+    def scrape_listing_pages(self, href_values, cache):
         """
+        Scrape model names, repositories, addresses, and URLs from the listing pages in one pass.
 
-
-        model_names = []
-
-        for url in href_values:
-            # Fetch HTML content from the URL
-            response_text = self.get_or_cache_html(url, cache)
-            if response_text is not None:
-                # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find all elements with class="block p-2"
-                elements = soup.find_all(class_='block p-2')
-
-                # Extract the href attribute values from these elements
-                href_values = [element['href'] for element in elements if 'href' in element.attrs]
-
-                # Extract only the text after the last '/' in each href value if there are at least two slashes
-                model_names.extend([href.split('/')[-1] if href.count('/') >= 2 else ' ' for href in href_values])
-
-        return model_names
-
-    # Method to scrape model repositories from Hugging Face
-    def scrape_model_repositories(self, href_values, cache):
-        """
-        Scrape and extract model repositories from a list of Hugging Face model page URLs.
+        All four outputs come from the same 'href' attribute of the anchors with class "block p-2",
+        so each listing page is fetched and parsed exactly once and every anchor visited exactly once,
+        instead of rebuilding the tree per output. Results are yielded one model at a time so callers
+        can consume them without materializing parallel lists.
 
         Args:
-            href_values (list): A list of URLs pointing to Hugging Face model pages.
-            cache (dict): A dictionary for caching HTML content to reduce redundant requests.
-
-        Returns:
-            list: A list of model repositories extracted from the provided URLs.
-        """
-
-        model_repo = []
-
-        for url in href_values:
-            # Fetch HTML content from the URL
-            response_text = self.get_or_cache_html(url, cache)
-            if response_text is not None:
-                # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find all elements with class="block p-2"
-                elements = soup.find_all(class_='block p-2')
-
-                # Extract the href attribute values from these elements
-                href_values = [element['href'] for element in elements if 'href' in element.attrs]
-
-                # Extract and return only the text between slashes
-                model_repo.extend([href.split('/')[1] for href in href_values])
-
-        return model_repo
-
-    # Method to scrape model addresses from Hugging Face
-    def model_addresses(self, href_values, cache):
-        """
-        Scrape and extract model addresses from Hugging Face model pages.
-
-        Args:
-            href_values (list): A list of URLs to Hugging Face model pages.
-            cache (dict): A dictionary for caching HTML content to reduce redundant requests.
-
-
-        Returns:
-            list: A list of model addresses extracted from the provided URLs.
-        """
-
-
-        model_address = []
-
-        for url in href_values:
-            # Fetch HTML content from the base URL
-            response_text = self.get_or_cache_html(url, cache)
-            if response_text is not None:
-
-                # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find all elements with class="block p-2"           <a class="block p-2" href="/stabilityai/control-lora">
-                elements = soup.find_all(class_='block p-2')
-
-                # Extract the href attribute values from these elements
-                # model_address = [element['href'] for element in elements if 'href' in element.attrs]
-                model_address.extend([element['href'] for element in elements if 'href' in element.attrs])
-
-        return model_address
-
-    # Method to scrape model URLs from Hugging Face
-    def fetch_huggingface_model_urls(self, href_values, cache):
-        """
-        Scrapes Hugging Face model URLs from a list of model page URLs.
-
-        Args:
-            href_values (list): A list of URLs to Hugging Face model pages.
-            cache (dict): A dictionary for caching HTML content.
+            href_values (list): A list of URLs pointing to Hugging Face model listing pages.
+            cache (dict): A dictionary for caching fetched HTML content.
 
-        Returns:
-            list: A list of Hugging Face model URLs extracted from the provided model page URLs.
+        Yields:
+            tuple: One (model_name, model_repo, model_address, model_url) tuple per model.
         """
 
-        model_url = []
-
         for url in href_values:
             # Fetch HTML content from the URL
             response_text = self.get_or_cache_html(url, cache)
             if response_text is not None:
-                # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find all elements with class="block p-2"
-                elements = soup.find_all(class_='block p-2')
-
-                # Extract the href attribute values from these elements
-                model_url.extend([f'https://huggingface.co{element["href"]}' for element in elements if 'href' in element.attrs])
-
-        return model_url
-
-    # Method to scrape GitHub links
-    def scrape_github_links(self, model_urls, cache):
-        """
-        Scrape and extract unique GitHub links from a list of Hugging Face model URLs.
-
-        Args:
-            model_urls (list): A list of Hugging Face model URLs to scrape for GitHub links.
-            cache (dict): A dictionary for caching HTML content of the URLs.
-
-        Returns:
-            list: A list of unique GitHub links found in the provided URLs, separated by commas.
-        """
-
-        # Initialize an empty list to store the results
-        results = []
-
-        for url in model_urls:
-            # Create an empty set to store unique GitHub links for the current URL
-            unique_github_links = set()
-
-            # Fetch HTML content from the URL
-            response_text = self.get_or_cache_html(url, cache)
-            if response_text is not None:
-                # Use a regular expression to find links in the format 'pip install git+https://github.com/...'
-                pip_links = re.findall(r'pip install git\+(https://github\.com/[^\s]+)', response_text)
-
-                # Iterate through the pip links and add them to the set of unique GitHub links
-                for pip_link in pip_links:
-                    unique_github_links.add(pip_link)
-
-                # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find all <a> tags with href attributes
-                links = soup.find_all('a', href=True)
-
-                # Iterate through the links and extract the ones starting with 'https://github.com/'
-                for link in links:
-                    href = link['href']
-                    if href.startswith('https://github.com/') or href.startswith('http://github.com/'):
-                        unique_github_links.add(href)
-
-                # Print the unique GitHub links for the current URL, separated by commas
-                output = ', '.join(unique_github_links)
-                results.append(output)
-
-        return results
-
-    # Method to scrape only model cards from Hugging Face
-    def scrape_model_cards(self, model_urls, cache):
+                # Parse the HTML content with selectolax (lexbor keeps the tree in C memory)
+                tree = LexborHTMLParser(response_text)
+
+                # Find all anchor elements with class="block p-2"    <a class="block p-2" href="/stabilityai/control-lora">
+                for element in tree.css('a.block.p-2'):
+                    href = element.attributes.get('href')
+
+                    # Skip missing or malformed hrefs before splitting — anything without
+                    # the '/org/name' shape would raise IndexError on the repo split
+                    if not href or href.count('/') < 2:
+                        continue
+
+                    # Name is the text after the last '/', repo is the text between the
+                    # first two slashes, the href itself is the model address, and the
+                    # site root prepended forms the full model URL
+                    yield (
+                        href.split('/')[-1],
+                        href.split('/', 2)[1],
+                        href,
+                        f'https://huggingface.co{href}',
+                    )
+
+    # Method to scrape model card text, GitHub links, and categorized tags from the model pages
+    def scrape_model_details(self, model_urls, cache):
         """
-        Scrape and extract model card text from Hugging Face model pages.
+        Scrape model card text, GitHub links, and categorized tags from the model pages in one pass.
 
-        This function takes a list of model page URLs, fetches their HTML content, and extracts the model card text
-        from each page. Model card text typically includes detailed information about a model such as its description,
-        usage instructions, and related information. The function uses BeautifulSoup for HTML parsing and excludes
-        unnecessary elements like headers and buttons to clean the extracted text.
+        Each model page is fetched and parsed exactly once; the pip-install regex runs on the raw
+        HTML, a single walk over the <a> tags collects both GitHub links and categorized tags, and
+        the model card text is extracted from the same tree — instead of three separate tree builds.
+        Model card text typically includes detailed information about a model such as its description
+        and usage instructions; unnecessary elements like headers and buttons are excluded.
+        Results are yielded one page at a time so callers can stream them straight to disk without
+        holding every card text in memory.
 
         Args:
             model_urls (list): A list of URLs to Hugging Face model pages.
             cache (dict): A dictionary to cache fetched HTML content for optimization.
 
-        Returns:
-            list: A list of cleaned model card texts extracted from the provided URLs.
+        Yields:
+            tuple: One (cleaned_text, github_links, category_items) tuple per fetched page, holding
+            the cleaned model card text, comma-separated unique GitHub links, and categorized tags.
         """
-        all_texts = [] 
 
         for url in model_urls:
 
-            # Fetch HTML content from the base URL
+            # Fetch HTML content from the URL
             response_text = self.get_or_cache_html(url, cache)
             if response_text is not None:
 
-            # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find the <main> element with class "flex flex-1 flex-col"
-                main_element = soup.find('main', class_='flex flex-1 flex-col')
-
-                if main_element:
-                    # Find and exclude the <header> element within the <main> element
-                    header_element = main_element.find('header', class_='from-gray-50-to-white border-b border-gray-100 bg-gradient-to-t via-white dark:via-gray-950 pt-6 sm:pt-9')
-                    if header_element:
-                        # Remove the header element from the DOM
-                        header_element.extract()  
-                    
-                    # Find and exclude the element with class "pt-8 border-gray-100 md:col-span-5 pt-6 md:pb-24 md:pl-6 md:border-l order-first md:order-none"
-                    div_element = main_element.find('div', class_='pt-8 border-gray-100 md:col-span-5 pt-6 md:pb-24 md:pl-6 md:border-l order-first md:order-none')
-                    if div_element:
-
-                        # Remove the div element from the DOM
-                        div_element.extract()  
-
-                    # Find and exclude the <section> element with the same class as the div element
-                    section_element = main_element.find('section', class_='pt-8 border-gray-100 md:col-span-5 pt-6 md:pb-24 md:pl-6 md:border-l order-first md:order-none')
-                    if section_element:
-                        # Remove the section element from the DOM
-                        section_element.extract()  
-
-                    # Find and exclude the <a> element with class "btn mb-6 text-sm text-gray-600 md:absolute md:-right-6 md:top-0 md:mb-0 md:rounded-r-none md:rounded-t-none md:border-r-0 md:border-t-0 md:border-gray-100 md:bg-none"
-                    a_element = main_element.find('a', class_='btn mb-6 text-sm text-gray-600 md:absolute md:-right-6 md:top-0 md:mb-0 md:rounded-r-none md:rounded-t-none md:border-r-0 md:border-t-0 md:border-gray-100 md:bg-none')
-                    if a_element:
-                        # Remove the <a> element from the DOM
-                        a_element.extract() 
-
-                    # Extract all the text from the <main> element
-                    extracted_text = main_element.get_text(separator=' ')
-
-                    lines = [line.strip() for line in extracted_text.splitlines() if line.strip()]
-
-                    # Clean up the text by removing blank lines and leading spaces
-                    cleaned_text = " ".join(lines)
-
-                    # Append the cleaned text to the list
-                    all_texts.append(cleaned_text) 
-                    
-        return all_texts
-
-    # Method to scrape categorized tags from a list of model URLs
-    def scrape_category_tags(self, model_urls, cache):
-        """
-        Scrape and extract categorized tags from a list of model URLs.
-
-        Args:
-            model_urls (list): A list of URLs pointing to model detail pages.
-            cache (dict): A dictionary for caching HTML content of the URLs.
-
-        Returns:
-            list: A list of dictionaries containing categorized tags for each model URL.
-        """
-        # Initialize a list to store category items for each URL
-        all_category_items = []
-
-        for url in model_urls:
-
-            # Fetch HTML content from the base URL
-            response_text = self.get_or_cache_html(url, cache)
-            if response_text is not None:
-                # Parse the HTML content with BeautifulSoup
-                soup = BeautifulSoup(response_text, 'html.parser')
-
-                # Find all <a> tags within the HTML
-                a_tags = soup.find_all('a')
-
-                # Initialize empty lists for all categories
-                category_items = {'Task': [], 'Library': [], 'Language': [], 'Others': [], 'Arxiv': [], 'License': [], 'Dataset': []}
-
-                for a_tag in a_tags:
-                    href = a_tag.get('href', '')
-
-                    # Check href patterns and extract accordingly
-                    if href.startswith('/models?pipeline_tag='):
-                        heading = 'Task'
-                    elif href.startswith('/models?library='):
-                        heading = 'Library'
-                    elif href.startswith('/models?language='):
-                        heading = 'Language'
-                    elif href.startswith('/models?other='):
-                        if '=arxiv%' in href:
-                            heading = 'Arxiv'
-                        else:
-                            heading = 'Others'
-                    elif href.startswith('/models?license=license%3A'):
-                        heading = 'License'
-                    elif href.startswith('/models?dataset=dataset%3A'):
-                        heading = 'Dataset'
-                    else:
-                        continue  # Skip if the href doesn't match any pattern
-
-                    tag_text = a_tag.get_text().strip()
-                    # Remove newline characters from the tag_text
-                    tag_text = tag_text.replace('\n', '')
-                    if heading == 'License':
-                        # Remove 'License:' prefix
-                        tag_text = tag_text.replace('License: ', '')
-                    category_items[heading].append(tag_text)
-
-                # Add the category items for the current URL to the list
-                all_category_items.append(category_items)
-
-        return all_category_items
+                # Emit the card text, comma-separated GitHub links, and tags for this page
+                yield parse_model_page(response_text)
 
     # Method to save data to a CSV file
     def save_to_csv(self, data, csv_file_path):
@@ -514,9 +454,10 @@ class HuggingFaceScraper:
         """
 
         try:
-            # Open the CSV file for writing
-            with open(csv_file_path, mode='w', newline='', encoding='utf-8') as csv_file:
-                writer = csv.writer(csv_file)
+            # Open the CSV file for writing with a 1 MiB buffer so long Body rows
+            # coalesce into far fewer write() syscalls than the default 8 KB buffer
+            with open(csv_file_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as csv_file:
+                writer = csv.writer(csv_file, quoting=csv.QUOTE_MINIMAL)
 
                 # Write header row
                 writer.writerow(["Sr.no", "ModelName", "ModelRepo", "ModelAddress", "ModelUrl", "Tasks","Libraries","Dataset","Languages","Other","Arxiv","Licenses", "Github Links", "Body"])
@@ -549,8 +490,8 @@ class HuggingFaceScraper:
         # Define the base URL
         base_url = 'https://huggingface.co/models'
 
-        # Fetch HTML content from the base URL and cache it
-        cache = {}
+        # Fetch HTML content from the base URL and cache it (LRU-bounded)
+        cache = OrderedDict()
         base_html_content = self.get_or_cache_html(base_url, cache)
 
         if base_html_content is None:
@@ -559,34 +500,48 @@ class HuggingFaceScraper:
         # Generate model page URLs with pagination
         href_values = self.generate_model_page_urls_with_pagination(base_url, batch_size=50)
         # print(len(href_values))
-        # Scrape various data from the generated model URLs
-        model_names = self.scrape_model_names(href_values, cache)
-        model_repo = self.scrape_model_repositories(href_values, cache)
-        model_addresses = self.model_addresses(href_values, cache)
-        # print(model_addresses)
-        model_urls = self.fetch_huggingface_model_urls(href_values, cache)
-        extract_model_cards = self.scrape_model_cards(model_urls, cache)
-        scrape_github_links = self.scrape_github_links(model_urls, cache)
-        scrape_category_tags = self.scrape_category_tags(model_urls, cache)
-
-        # Extracting and formatting data for each Tag category:
-        task_data = [', '.join(x['Task']) for x in scrape_category_tags]
-        library_data = [', '.join(x['Library']) for x in scrape_category_tags]
-        dataset_data = [', '.join(x['Dataset']) for x in scrape_category_tags]
-        arxiv_data = [', '.join(x['Arxiv']) for x in scrape_category_tags]
-        language_data = [', '.join(x['Language']) for x in scrape_category_tags]
-        others_data = [', '.join(x['Others']) for x in scrape_category_tags]
-        license_data = [', '.join(x['License']) for x in scrape_category_tags]
-
-
-        # # Zip the data for writing to a CSV file
-        rows = zip(range(1, len(model_names) + 1), model_names, model_repo, model_addresses, model_urls, task_data, library_data, dataset_data, language_data, others_data, arxiv_data, license_data, scrape_github_links, extract_model_cards)
+
+        # Fetch all listing pages concurrently so the scrape_* calls below hit a warm cache
+        asyncio.run(self.fetch_all(href_values, cache))
+
+        # Scrape names, repositories, addresses, and URLs from the listing pages in one pass
+        listing_rows = list(self.scrape_listing_pages(href_values, cache))
+        model_urls = [model_url for _, _, _, model_url in listing_rows]
+        # print(len(listing_rows))
+
+        # Fetch all model pages concurrently so the remaining scraping is pure CPU work
+        asyncio.run(self.fetch_all(model_urls, cache))
+
+        # Split the cached pages into one chunk per core so parsing uses every CPU;
+        # the fetch phase above is I/O-bound, but the parse phase is pure Python/C work
+        workers = os.cpu_count() or 1
+        chunk_size = max(1, -(-len(model_urls) // workers))
+        html_chunks = [
+            [cache.get(model_url) for model_url in model_urls[start:start + chunk_size]]
+            for start in range(0, len(model_urls), chunk_size)
+        ]
 
         # Specify the CSV file path
         csv_file_path = r'E:\VSCODE\hugging_face_scraping.csv'
 
-        # Save the data to a CSV file
-        self.save_to_csv(rows, csv_file_path)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Parse chunks in parallel across processes; map yields chunk results in
+            # order, so the rows below still stream chunk by chunk
+            model_details = chain.from_iterable(executor.map(parse_model_pages_chunk, html_chunks))
+
+            # Assemble one CSV row at a time so the heavy card texts are never all resident at once
+            rows = (
+                (index, name, repo, address, url,
+                 ', '.join(categories[TASK]), ', '.join(categories[LIBRARY]),
+                 ', '.join(categories[DATASET]), ', '.join(categories[LANGUAGE]),
+                 ', '.join(categories[OTHERS]), ', '.join(categories[ARXIV]),
+                 ', '.join(categories[LICENSE]), github_links, card_text)
+                for index, ((name, repo, address, url), (card_text, github_links, categories))
+                in enumerate(zip(listing_rows, model_details), start=1)
+            )
+
+            # Save the data to a CSV file
+            self.save_to_csv(rows, csv_file_path)
 
 # Entry point of the script
 if __name__ == "__main__":